@@ -1,11 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Query
-import uuid
+import os
+import re
 from typing import List, Optional
-from pydantic import ValidationError
 
 import requests
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from app.models.book_models import Book, BookCreate, BookUpdate, BookResponse
+from app.models.book_models import Book, BookCreate, BookResponse, BookUpdate
 from app.services.storage import storage, book_to_response
 from app.utils.logger import logger
 from app.utils.exceptions import create_error_response
@@ -13,6 +15,37 @@ from app.utils.exceptions import create_error_response
 
 router = APIRouter()
 
+# Validating IDs only needs a yes/no answer; matching against a precompiled
+# pattern avoids parsing the hex and allocating a UUID object per request.
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.I
+)
+_is_valid_uuid = _UUID_RE.match
+
+# Static error payloads shared across requests; the error paths only ever
+# read these, so one dict per message is enough.
+_ERR_BAD_UUID = create_error_response("validation_error", "Invalid book ID format")
+_ERR_NOT_FOUND = create_error_response("http_error", "Book not found")
+
+# One adapter shared by the list endpoint: serializing the whole list in a
+# single Rust-core call instead of one Python conversion per book.
+_BOOKS_ADAPTER = TypeAdapter(List[Book])
+
+# 256-entry hex lookup table for formatting random bytes into an id without
+# going through UUID.__init__/__str__.
+_HEX = [f"{i:02x}" for i in range(256)]
+
+
+def _fast_uuid4() -> str:
+    """Generate a random version-4 UUID string."""
+    b = os.urandom(16)
+    h = _HEX
+    return (
+        f"{h[b[0]]}{h[b[1]]}{h[b[2]]}{h[b[3]]}-{h[b[4]]}{h[b[5]]}-"
+        f"{h[(b[6] & 0x0F) | 0x40]}{h[b[7]]}-{h[(b[8] & 0x3F) | 0x80]}{h[b[9]]}-"
+        f"{h[b[10]]}{h[b[11]]}{h[b[12]]}{h[b[13]]}{h[b[14]]}{h[b[15]]}"
+    )
+
 @router.get("/random-number")
 def random_number():
     url = "https://www.randomnumberapi.com/api/v1.0/random?min=100&max=1000&count=5"
@@ -27,68 +60,46 @@ def random_number_sum():
     return sum(response.json())
 
 
+# The book endpoints keep response_model for the OpenAPI contract but
+# return ORJSONResponse instances directly — FastAPI skips outbound
+# validation/serialization for handlers that return a Response, so the
+# hot path is a single orjson dump of the storage payload.
 @router.post(
     "/create-book",
     response_model=BookResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new book",
 )
-async def create_book(book_data: BookCreate) -> BookResponse:
+async def create_book(book_data: BookCreate) -> ORJSONResponse:
     """Create a new book"""
-    try:
-        book_id = str(uuid.uuid4())
-
-        logger.debug(
-            "Creating a new book",
-            book_id=str(book_id),
-            title=book_data.title,
-            author=book_data.author,
-        )
-
-        book = Book(
-            id=book_id,
-            title=book_data.title,
-            author=book_data.author,
-            published_year=book_data.published_year,
-            price=book_data.price,
-            tags=book_data.tags,
-        )
-
-        created_book = storage.create_book(book)
-        logger.debug(
-            "Book created successfully",
-            book_id=str(created_book.id),
-            title=created_book.title,
-        )
-
-        return book_to_response(created_book)
-
-    except ValidationError as e:
-        logger.error("Validation error while creating book", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=create_error_response(
-                "validation_error", f"Invalid book data: {str(e)}"
-            ),
-        )
-    except ValueError as e:
-        logger.error("Value error while creating book", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=create_error_response(
-                "validation_error", f"Invalid input: {str(e)}"
-            ),
-        )
-    except Exception as e:
-        logger.error(
-            "Unexpected error while creating book",
-            error=str(e),
-            book_data=book_data.model_dump(),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=create_error_response("internal_error", "Failed to create book"),
-        )
+    book_id = _fast_uuid4()
+
+    logger.debug(
+        "Creating a new book",
+        book_id=book_id,
+        title=book_data.title,
+        author=book_data.author,
+    )
+
+    book = Book(
+        id=book_id,
+        title=book_data.title,
+        author=book_data.author,
+        published_year=book_data.published_year,
+        price=book_data.price,
+        tags=book_data.tags,
+    )
+
+    created_book = storage.create_book(book)
+    logger.debug(
+        "Book created successfully",
+        book_id=created_book.id,
+        title=created_book.title,
+    )
+
+    return ORJSONResponse(
+        book_to_response(created_book), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
@@ -97,46 +108,29 @@ async def create_book(book_data: BookCreate) -> BookResponse:
     summary="Get a book by ID",
     description="Retrieves a specific book by its UUID.",
 )
-async def get_book(book_id: str) -> BookResponse:
+async def get_book(book_id: str) -> ORJSONResponse:
     """Get a book by its ID"""
-    try:
-        logger.debug("Retrieving book", book_id=book_id)
-
-        # Validate UUID format
-        try:
-            uuid.UUID(book_id)
-        except ValueError:
-            logger.warning("Invalid UUID format", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=create_error_response(
-                    "validation_error", "Invalid book ID format"
-                ),
-            )
-
-        book = storage.get_book(book_id)
-        if not book:
-            logger.warning("Book not found", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=create_error_response("http_error", "Book not found"),
-            )
-
-        logger.debug("Book retrieved successfully", book_id=book_id)
-        return book_to_response(book)
-
-    except HTTPException:
-        # Re-raise HTTP exceptions (they're already handled properly)
-        raise
-    except Exception as e:
-        logger.error(
-            "Unexpected error while retrieving book", error=str(e), book_id=book_id
+    logger.debug("Retrieving book", book_id=book_id)
+
+    # Validate UUID format
+    if not _is_valid_uuid(book_id):
+        logger.warning("Invalid UUID format", book_id=book_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_ERR_BAD_UUID,
         )
+
+    book = storage.get_book(book_id)
+    if not book:
+        logger.warning("Book not found", book_id=book_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=create_error_response("internal_error", "Failed to retrieve book"),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_ERR_NOT_FOUND,
         )
 
+    logger.debug("Book retrieved successfully", book_id=book_id)
+    return ORJSONResponse(book_to_response(book))
+
 
 @router.put(
     "/books/{book_id}",
@@ -144,85 +138,37 @@ async def get_book(book_id: str) -> BookResponse:
     summary="Update a book",
     description="Updates an existing book. All fields are optional in the request body.",
 )
-async def update_book(book_id: str, book_update: BookUpdate) -> BookResponse:
+async def update_book(book_id: str, book_update: BookUpdate) -> ORJSONResponse:
     """Update an existing book."""
-    try:
-        logger.debug("Updating book", book_id=book_id)
-
-        # Validate UUID format
-        try:
-            uuid.UUID(book_id)
-        except ValueError:
-            logger.warning("Invalid UUID format for update", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=create_error_response(
-                    "validation_error", "Invalid book ID format"
-                ),
-            )
-
-        existing_book = storage.get_book(book_id)
-        if not existing_book:
-            logger.warning("Book not found for update", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=create_error_response("http_error", "Book not found"),
-            )
-
-        # Update only provided fields
-        update_data = book_update.model_dump(exclude_unset=True)
-
-        updated_book = Book(
-            id=book_id,
-            title=update_data.get("title", existing_book.title),
-            author=update_data.get("author", existing_book.author),
-            published_year=update_data.get(
-                "published_year", existing_book.published_year
-            ),
-            price=update_data.get("price", existing_book.price),
-            tags=update_data.get("tags", existing_book.tags),
-        )
-
-        storage.update_book(book_id, updated_book)
+    logger.debug("Updating book", book_id=book_id)
 
-        logger.info(
-            "Book updated successfully",
-            book_id=str(book_id),
-            updated_fields=list(update_data.keys()),
+    # Validate UUID format
+    if not _is_valid_uuid(book_id):
+        logger.warning("Invalid UUID format for update", book_id=book_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_ERR_BAD_UUID,
         )
 
-        return book_to_response(updated_book)
+    # Update only provided fields, mutating the stored book in place
+    update_data = book_update.model_dump(exclude_unset=True)
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except ValidationError as e:
-        logger.error(
-            "Validation error while updating book", error=str(e), book_id=book_id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=create_error_response(
-                "validation_error", f"Invalid update data: {str(e)}"
-            ),
-        )
-    except ValueError as e:
-        logger.error("Value error while updating book", error=str(e), book_id=book_id)
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=create_error_response(
-                "validation_error", f"Invalid input: {str(e)}"
-            ),
-        )
-    except Exception as e:
-        logger.error(
-            "Unexpected error while updating book", error=str(e), book_id=book_id
-        )
+    updated_book = storage.patch_book(book_id, update_data)
+    if not updated_book:
+        logger.warning("Book not found for update", book_id=book_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=create_error_response("internal_error", "Failed to update book"),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_ERR_NOT_FOUND,
         )
 
+    logger.info(
+        "Book updated successfully",
+        book_id=book_id,
+        updated_fields=list(update_data.keys()),
+    )
+
+    return ORJSONResponse(book_to_response(updated_book))
+
 
 @router.delete(
     "/books/{book_id}",
@@ -232,44 +178,27 @@ async def update_book(book_id: str, book_update: BookUpdate) -> BookResponse:
 )
 async def delete_book(book_id: str):
     """Delete a book by its ID."""
-    try:
-        logger.debug("Deleting book", book_id=book_id)
-
-        # Validate UUID format
-        try:
-            uuid.UUID(book_id)
-        except ValueError:
-            logger.warning("Invalid UUID format for deletion", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=create_error_response(
-                    "validation_error", "Invalid book ID format"
-                ),
-            )
-
-        deleted = storage.delete_book(book_id)
-        if not deleted:
-            logger.warning("Book not found for deletion", book_id=book_id)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=create_error_response("http_error", "Book not found"),
-            )
-
-        logger.info("Book deleted successfully", book_id=book_id)
-        return {"status": "SUCCESS", "message": "Book deleted successfully"}
-
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(
-            "Unexpected error while deleting book", error=str(e), book_id=book_id
+    logger.debug("Deleting book", book_id=book_id)
+
+    # Validate UUID format
+    if not _is_valid_uuid(book_id):
+        logger.warning("Invalid UUID format for deletion", book_id=book_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_ERR_BAD_UUID,
         )
+
+    deleted = storage.delete_book(book_id)
+    if not deleted:
+        logger.warning("Book not found for deletion", book_id=book_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=create_error_response("internal_error", "Failed to delete book"),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_ERR_NOT_FOUND,
         )
 
+    logger.info("Book deleted successfully", book_id=book_id)
+    return {"status": "SUCCESS", "message": "Book deleted successfully"}
+
 
 @router.get(
     "/get-books",
@@ -279,24 +208,15 @@ async def delete_book(book_id: str):
 )
 async def list_books(
     tag: Optional[str] = Query(None, description="Filter books by tag"),
-) -> List[BookResponse]:
+) -> ORJSONResponse:
     """List all books, optionally filtered by tag"""
-    try:
-        logger.debug("Listing books", tag_filter=tag)
-
-        books = storage.list_books(tag_filter=tag)
-        logger.debug("Books retrieved successfully", count=len(books), tag_filter=tag)
+    logger.debug("Listing books", tag_filter=tag)
 
-        return [book_to_response(book) for book in books]
+    books = storage.list_books(tag_filter=tag)
+    logger.debug("Books retrieved successfully", count=len(books), tag_filter=tag)
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(
-            "Unexpected error while listing books", error=str(e), tag_filter=tag
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=create_error_response("internal_error", "Failed to retrieve books"),
-        )
+    # The no-filter path hands back a dict view; the adapter needs a
+    # concrete list, so this is the single materialization per request.
+    if not isinstance(books, list):
+        books = list(books)
+    return ORJSONResponse(_BOOKS_ADAPTER.dump_python(books, mode="json"))
@@ -1,8 +1,5 @@
 import structlog
-import os
-import glob
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 from app.utils.logger import configure_logging
 
@@ -13,9 +10,6 @@ async def startup_tasks():
     """Execute startup tasks."""
     log.info("Application startup")
 
-    # Clear old log files
-    await clear_old_logs()
-
     # Add other startup tasks here
     # await init_database()
     # await load_config()
@@ -30,34 +24,13 @@ async def shutdown_tasks():
     # await cleanup_temp_files()
 
 
-async def clear_old_logs():
-    """Clear old log files on startup."""
-    try:
-        log_dir = Path("logs")
-        if log_dir.exists():
-            # Remove log files older than 7 days or clear all - adjust as needed
-            log_files = glob.glob("logs/*.log*")
-            for log_file in log_files:
-                try:
-                    os.remove(log_file)
-                    log.info(f"Removed old log file: {log_file}")
-                except OSError as e:
-                    log.warning(f"Could not remove log file {log_file}: {e}")
-
-        # Ensure logs directory exists
-        log_dir.mkdir(exist_ok=True)
-        log.info("Log cleanup completed")
-
-    except Exception as e:
-        log.error(f"Error during log cleanup: {e}")
-
-
 @asynccontextmanager
 async def lifespan(app):
     """Handle startup and shutdown events."""
-    # Startup
-    await clear_old_logs()
-
+    # Startup. configure_logging is a true no-op when the import-time
+    # call already ran; the stale-log sweep happens inside it, before
+    # the file handler first opens the log path, so nothing unlinks a
+    # file a handler is holding open.
     configure_logging()
     await startup_tasks()
 
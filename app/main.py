@@ -1,19 +1,37 @@
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from app.utils.config import settings
-import structlog
+from app.utils.logger import configure_logging, get_logger
 
-from app.utils.exceptions import validation_exception_handler, general_exception_handler
+from pydantic import ValidationError
+
+from app.utils.exceptions import (
+    validation_exception_handler,
+    value_error_handler,
+    general_exception_handler,
+)
 from app.api.routes.books import router as book_router
 from app.events.lifecycle import lifespan
 
 
-# configure_logging()
-log = structlog.get_logger()
+# Configure before the first log call so the cached bound loggers pick
+# up the real processor chain. This first call sweeps stale log files
+# and builds the handlers; the lifespan's call returns early without
+# touching them.
+configure_logging()
+log = get_logger()
 
-app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, lifespan=lifespan)
+app = FastAPI(
+    title=settings.APP_NAME,
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(ValidationError, value_error_handler)
+app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 app.include_router(book_router)
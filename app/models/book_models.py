@@ -1,46 +1,47 @@
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, field_validator
-from pydantic.dataclasses import dataclass
+
+
+# Upper bound for published_year, computed once at import instead of a
+# datetime.now() call per evaluation.
+_CURRENT_YEAR = datetime.now().year
 
 
 # ------------------ Internal Business Entity -------------------------
 
-@dataclass(validate_on_init=True)
-class Book:
-    """Internal business entity for Book."""
+class _ResponseCacheMixin:
+    """Carries the memoized response-dict slot for Book.
+
+    Kept out of the dataclass fields so it never shows up in
+    ``dataclasses.fields`` or serialized output; storage invalidates it
+    when a book is mutated.
+    """
+
+    __slots__ = ("_cached_dict",)
+
+
+@dataclass(slots=True)
+class Book(_ResponseCacheMixin):
+    """Internal business entity for Book.
+
+    A plain slotted dataclass: all data reaching it has already been
+    validated by the API request models, so it carries no validators and
+    no per-instance __dict__.
+    """
 
     id: str
     title: str
     author: str
     published_year: int
     price: float
-    tags: Optional[List[str]] = None
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
-
-    @field_validator("title", "author")
-    @classmethod
-    def validate_non_empty_strings(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty or contain only whitespace")
-        return v.strip()
-
-    @field_validator("published_year")
-    @classmethod
-    def validate_year(cls, v: int) -> int:
-        current_year = datetime.now().year
-        if not (1900 <= v <= current_year):
-            raise ValueError("Year must be between 1900 and the current year")
-        return v
-
-    @field_validator("price")
-    @classmethod
-    def validate_price(cls, v: float) -> float:
-        if v <= 0:
-            raise ValueError("Price must be greater than 0")
-        return v
+    # Storage freezes tags to a tuple of interned strings; a list is still
+    # accepted for instances built outside of storage.
+    tags: Optional[Union[Tuple[str, ...], List[str]]] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
 
 # ------------------ API Request Model -------------------------
@@ -64,7 +65,7 @@ class BookCreate(BaseModel):
         ..., 
         description="Year the book was published",
         ge=1900,
-        le=datetime.now().year,
+        le=_CURRENT_YEAR,
         json_schema_extra={"example": 1994}
     )
     price: float = Field(
@@ -118,7 +119,7 @@ class BookUpdate(BaseModel):
         None, 
         description="Updated year", 
         ge=1900, 
-        le=datetime.now().year
+        le=_CURRENT_YEAR
     )
     price: Optional[float] = Field(
         None, 
@@ -131,6 +132,17 @@ class BookUpdate(BaseModel):
         description="Updated list of tags"
     )
 
+    @field_validator("title", "author", "published_year", "price", mode="before")
+    @classmethod
+    def reject_explicit_null(cls, v):
+        # Validators only run for fields the client actually sent, so
+        # this fires on an explicit JSON null but not on an omitted
+        # field. Every field except tags is non-nullable on the stored
+        # book; letting null through would corrupt it.
+        if v is None:
+            raise ValueError("Field cannot be null")
+        return v
+
     @field_validator("title", "author")
     @classmethod
     def validate_optional_non_empty_strings(cls, v: Optional[str]) -> Optional[str]:
@@ -172,7 +184,7 @@ class BookResponse(BaseModel):
 
     @classmethod
     def from_book(cls, book: Book) -> "BookResponse":
-        return cls(**book.__dict__)
+        return cls(**{f.name: getattr(book, f.name) for f in fields(book)})
 
     model_config = {
         "from_attributes": True,
@@ -1,10 +1,32 @@
-from typing import Dict, List, Optional
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set, Tuple
 import logging
-from app.models.book_models import Book, BookResponse
+from app.models.book_models import Book
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sentinel for dict.pop, so deletion is a single hash probe.
+_MISSING = object()
+
+
+def _freeze_tags(tags) -> Optional[Tuple[str, ...]]:
+    """Normalize a tag collection to a tuple of interned strings.
+
+    Tags repeat heavily across books ("fiction", "classic", ...);
+    interning makes every book share one string object per tag, which
+    cuts memory and turns tag equality/membership checks into pointer
+    comparisons. The tuple also makes the stored collection immutable.
+
+    None and an explicit empty list are distinct API states (null vs []
+    in responses), so only None maps to None; [] becomes ().
+    """
+    if tags is None:
+        return None
+    return tuple(sys.intern(tag) for tag in tags)
+
 
 class BookStorageError(Exception):
     """Custom exception for book storage operations"""
@@ -13,185 +35,149 @@ class BookStorageError(Exception):
 
 
 class BookStorage:
-    """In-memory storage for books"""
+    """In-memory storage for books.
+
+    Data arriving here has already been validated by the API request
+    models, so the methods carry only business-logic checks — no
+    defensive re-validation of the inputs.
+    """
 
     def __init__(self):
-        try:
-            self._books: Dict[str, Book] = {}
-            logger.info("BookStorage initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize BookStorage: {e}")
-            raise BookStorageError(f"Storage initialization failed: {e}")
+        self._books: Dict[str, Book] = {}
+        # Inverted index: tag -> ids of books carrying it, so tag
+        # filtering is a set lookup instead of a full scan.
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
 
     def create_book(self, book: Book) -> Book:
         """Store a new book"""
-        try:
-            if not book or not hasattr(book, "id"):
-                raise ValueError("Invalid book object provided")
-
-            if not book.id:
-                raise ValueError("Book ID cannot be empty")
-
-            if book.id in self._books:
-                raise ValueError(f"Book with ID '{book.id}' already exists")
-
-            self._books[book.id] = book
-            logger.info(f"Book created successfully with ID: {book.id}")
-            return book
-
-        except ValueError as e:
-            logger.error(f"Validation error creating book: {e}")
-            raise BookStorageError(f"Failed to create book: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error creating book: {e}")
-            raise BookStorageError(f"Unexpected error during book creation: {e}")
+        if book.id in self._books:
+            raise BookStorageError(
+                f"Failed to create book: Book with ID '{book.id}' already exists"
+            )
+
+        book.tags = _freeze_tags(book.tags)
+        self._books[book.id] = book
+        for tag in book.tags or ():
+            self._by_tag[tag].add(book.id)
+        logger.info(f"Book created successfully with ID: {book.id}")
+        return book
+
+    def _unindex_tags(self, book: Book) -> None:
+        """Remove a book's entries from the tag index."""
+        for tag in book.tags or ():
+            ids = self._by_tag.get(tag)
+            if ids:
+                ids.discard(book.id)
+                if not ids:
+                    del self._by_tag[tag]
 
     def get_book(self, book_id: str) -> Optional[Book]:
         """Retrieve a book by ID"""
-        try:
-            if not book_id:
-                raise ValueError("Book ID cannot be empty")
-
-            book = self._books.get(book_id)
-            if book:
-                logger.debug(f"Book retrieved successfully: {book_id}")
-            else:
-                logger.debug(f"Book not found: {book_id}")
-
-            return book
-
-        except ValueError as e:
-            logger.error(f"Validation error retrieving book: {e}")
-            raise BookStorageError(f"Failed to retrieve book: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving book {book_id}: {e}")
-            raise BookStorageError(f"Unexpected error during book retrieval: {e}")
+        return self._books.get(book_id)
 
     def update_book(self, book_id: str, book: Book) -> Optional[Book]:
         """Update an existing book"""
-        try:
-            if not book_id:
-                raise ValueError("Book ID cannot be empty")
-
-            if not book or not hasattr(book, "id"):
-                raise ValueError("Invalid book object provided")
-
-            if book_id not in self._books:
-                logger.warning(f"Attempted to update non-existent book: {book_id}")
-                return None
-
-            # Ensure the book object has the correct ID
-            book.id = book_id
-            self._books[book_id] = book
-            logger.info(f"Book updated successfully: {book_id}")
-            return book
-
-        except ValueError as e:
-            logger.error(f"Validation error updating book: {e}")
-            raise BookStorageError(f"Failed to update book: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating book {book_id}: {e}")
-            raise BookStorageError(f"Unexpected error during book update: {e}")
+        if book_id not in self._books:
+            logger.warning(f"Attempted to update non-existent book: {book_id}")
+            return None
+
+        # Ensure the book object has the correct ID
+        book.id = book_id
+        book.tags = _freeze_tags(book.tags)
+        self._unindex_tags(self._books[book_id])
+        self._books[book_id] = book
+        for tag in book.tags or ():
+            self._by_tag[tag].add(book_id)
+        logger.info(f"Book updated successfully: {book_id}")
+        return book
+
+    def patch_book(self, book_id: str, changes: Dict) -> Optional[Book]:
+        """Apply a partial update to an existing book in place.
+
+        Avoids rebuilding (and revalidating) a whole Book for a partial
+        update; only the changed fields and the updated_at timestamp are
+        touched.
+        """
+        book = self._books.get(book_id)
+        if not book:
+            logger.warning(f"Attempted to patch non-existent book: {book_id}")
+            return None
+
+        if "tags" in changes:
+            self._unindex_tags(book)
+        for field_name, value in changes.items():
+            setattr(book, field_name, value)
+        if "tags" in changes:
+            book.tags = _freeze_tags(book.tags)
+            for tag in book.tags or ():
+                self._by_tag[tag].add(book_id)
+        book.updated_at = datetime.now()
+        # The memoized response payload no longer matches the book.
+        book._cached_dict = None
+
+        logger.info(f"Book patched successfully: {book_id}")
+        return book
 
     def delete_book(self, book_id: str) -> bool:
         """Delete a book by ID"""
-        try:
-            if not book_id:
-                raise ValueError("Book ID cannot be empty")
-
-            if book_id in self._books:
-                del self._books[book_id]
-                logger.info(f"Book deleted successfully: {book_id}")
-                return True
-            else:
-                logger.warning(f"Attempted to delete non-existent book: {book_id}")
-                return False
-
-        except ValueError as e:
-            logger.error(f"Validation error deleting book: {e}")
-            raise BookStorageError(f"Failed to delete book: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting book {book_id}: {e}")
-            raise BookStorageError(f"Unexpected error during book deletion: {e}")
-
-    def list_books(self, tag_filter: Optional[str] = None) -> List[Book]:
-        """List all books, can be filtered by tag"""
-        try:
-            books = list(self._books.values())
-
-            if tag_filter:
-                try:
-                    filtered_books = []
-                    for book in books:
-                        if book.tags and tag_filter in book.tags:
-                            filtered_books.append(book)
-
-                    logger.debug(
-                        f"Books filtered by tag '{tag_filter}': {len(filtered_books)} found"
-                    )
-                    return filtered_books
-
-                except AttributeError as e:
-                    logger.error(f"Book object missing tags attribute: {e}")
-                    raise BookStorageError(f"Invalid book data structure: {e}")
-
-            logger.debug(f"All books listed: {len(books)} found")
-            return books
-
-        except Exception as e:
-            logger.error(f"Unexpected error listing books: {e}")
-            raise BookStorageError(f"Unexpected error during book listing: {e}")
+        book = self._books.pop(book_id, _MISSING)
+        if book is _MISSING:
+            logger.warning(f"Attempted to delete non-existent book: {book_id}")
+            return False
+
+        self._unindex_tags(book)
+        logger.info(f"Book deleted successfully: {book_id}")
+        return True
+
+    def list_books(self, tag_filter: Optional[str] = None) -> Iterable[Book]:
+        """List all books, can be filtered by tag.
+
+        The no-filter path returns the live ``dict_values`` view rather
+        than a copy; callers iterate it once to build the response, so
+        materializing an intermediate list here would only double the
+        transient memory.
+        """
+        if tag_filter:
+            return [
+                self._books[book_id]
+                for book_id in self._by_tag.get(tag_filter, ())
+            ]
+        return self._books.values()
 
     def clear(self):
         """Clear all books"""
-        try:
-            book_count = len(self._books)
-            self._books.clear()
-            logger.info(f"Storage cleared successfully. {book_count} books removed")
-
-        except Exception as e:
-            logger.error(f"Error clearing storage: {e}")
-            raise BookStorageError(f"Failed to clear storage: {e}")
-
-
-def book_to_response(book: Book) -> BookResponse:
-    """Convert internal Book entity to BookResponse model."""
-    try:
-        if not book:
-            raise ValueError("Book object cannot be None")
-
-        # Validate required attributes
-        required_attrs = ["id", "title", "author", "published_year", "price"]
-        for attr in required_attrs:
-            if not hasattr(book, attr):
-                raise AttributeError(f"Book object missing required attribute: {attr}")
-
-        response = BookResponse(
-            id=book.id,
-            title=book.title,
-            author=book.author,
-            published_year=book.published_year,
-            price=book.price,
-            tags=getattr(book, "tags", None),  # Handle optional tags
-            created_at=book.created_at,
-            updated_at=book.updated_at,
-        )
-
-        logger.debug(f"Book converted to response format: {book.id}")
-        return response
-
-    except (ValueError, AttributeError) as e:
-        logger.error(f"Validation error converting book to response: {e}")
-        raise BookStorageError(f"Failed to convert book to response: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error converting book to response: {e}")
-        raise BookStorageError(f"Unexpected error during conversion: {e}")
-
-
-# Initialize storage instance with error handling
-try:
-    storage = BookStorage()
-except BookStorageError as e:
-    logger.critical(f"Failed to initialize global storage instance: {e}")
-    # You might want to handle this differently based on your application needs
-    storage = None
+        self._books.clear()
+        self._by_tag.clear()
+
+
+def book_to_response(book: Book) -> Dict:
+    """Convert internal Book entity to a response payload.
+
+    Returns a plain dict rather than a BookResponse instance: the data
+    coming out of storage was already validated at the API boundary, and
+    a dict lets the ORJSON response class serialize it directly without
+    another validation pass.
+
+    The dict is memoized on the Book itself — a book is immutable
+    between updates, so repeated GETs of the same book reduce to one
+    attribute read. ``patch_book`` clears the memo on mutation.
+    """
+    cached = getattr(book, "_cached_dict", None)
+    if cached is not None:
+        return cached
+
+    response = {
+        "id": book.id,
+        "title": book.title,
+        "author": book.author,
+        "published_year": book.published_year,
+        "price": book.price,
+        "tags": book.tags,
+        "created_at": book.created_at,
+        "updated_at": book.updated_at,
+    }
+    book._cached_dict = response
+    return response
+
+
+storage = BookStorage()
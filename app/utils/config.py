@@ -1,6 +1,7 @@
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, NamedTuple
+
 from pydantic_settings import BaseSettings
-from pydantic import Field
 
 
 class Settings(BaseSettings):
@@ -12,7 +13,9 @@ class Settings(BaseSettings):
     PORT: int = 8000
     # Logging Configuration
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
-    LOG_ROTATION_TYPE: Literal["size", "time"] = "size"
+    # "external" delegates rotation to the OS (logrotate) via a
+    # WatchedFileHandler — the only multi-process-safe option.
+    LOG_ROTATION_TYPE: Literal["size", "time", "external"] = "size"
 
     # Size-based rotation settings
     LOG_MAX_BYTES: int = 10 * 1024 * 1024  # 10MB
@@ -33,4 +36,32 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+class FrozenSettings(NamedTuple):
+    """Immutable snapshot of Settings.
+
+    Validation happens once in ``Settings``; afterwards the values are
+    plain constants, and NamedTuple attribute access is a C-level slot
+    read instead of a trip through pydantic's machinery.
+    """
+
+    APP_NAME: str
+    DEBUG: bool
+    HOST: str
+    PORT: int
+    LOG_LEVEL: str
+    LOG_ROTATION_TYPE: str
+    LOG_MAX_BYTES: int
+    LOG_BACKUP_COUNT: int
+    LOG_ROTATION_WHEN: str
+    LOG_ROTATION_INTERVAL: int
+    LOG_TIMESTAMP_FORMAT: str
+    LOG_USE_UTC: bool
+
+
+@lru_cache
+def get_settings() -> FrozenSettings:
+    """Load and validate the environment once, then freeze it."""
+    return FrozenSettings(**Settings().model_dump())
+
+
+settings = get_settings()
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from app.utils.logger import logger
 
@@ -19,36 +19,36 @@ def create_error_response(
 
 
 def clean_validation_errors(errors: list) -> list:
-    """Clean validation errors to make them JSON serializable."""
-    cleaned_errors = []
-    for error in errors:
-        cleaned_error = {
+    """Clean validation errors to make them JSON serializable.
+
+    Pydantic v2 errors are already plain dicts; the only values that can
+    defeat the JSON encoder are Exception instances inside ``ctx``, so
+    stringify those in a single pass.
+    """
+    return [
+        {
             "type": error.get("type"),
             "loc": error.get("loc"),
             "msg": error.get("msg"),
             "input": error.get("input"),
+            **(
+                {
+                    "ctx": {
+                        key: str(value) if isinstance(value, Exception) else value
+                        for key, value in error["ctx"].items()
+                    }
+                }
+                if "ctx" in error
+                else {}
+            ),
         }
-
-        # Handle the ctx field which might contain non-serializable objects
-        if "ctx" in error:
-            ctx = error["ctx"]
-            cleaned_ctx = {}
-            for key, value in ctx.items():
-                if isinstance(value, Exception):
-                    # Convert exception to string representation
-                    cleaned_ctx[key] = str(value)
-                else:
-                    cleaned_ctx[key] = value
-            cleaned_error["ctx"] = cleaned_ctx
-
-        cleaned_errors.append(cleaned_error)
-
-    return cleaned_errors
+        for error in errors
+    ]
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handles Pydantic/FastAPI validation errors."""
     # Clean the errors to make them JSON serializable
     cleaned_errors = clean_validation_errors(exc.errors())
@@ -61,7 +61,7 @@ async def validation_exception_handler(
         errors=cleaned_errors,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=create_error_response(
             "validation_error", "Input validation failed", error_details
@@ -69,7 +69,22 @@ async def validation_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def value_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handles ValueError/ValidationError raised past request parsing."""
+    logger.warning(
+        "Invalid value during request handling",
+        path=request.url.path,
+        method=request.method,
+        error=str(exc),
+    )
+
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content=create_error_response("validation_error", f"Invalid input: {exc}"),
+    )
+
+
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handles unexpected internal errors without exposing internals."""
     logger.error(
         "Unexpected error occurred",
@@ -79,7 +94,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=create_error_response(
             "internal_error", "An unexpected error occurred. Please try again later."
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""Development environment setup for the Book Management API.
+
+Installs dependencies, checks the linting tools are available, wires up
+pre-commit when configured, and runs the suite once to confirm the
+environment works.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+
+# Ephemeral tooling subprocesses (pip, pre-commit) should not write
+# .pyc files into the tree; the pytest run shares the same out-of-tree
+# cache as scripts/run_tests.py.
+_TOOL_ENV = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONPYCACHEPREFIX": str(Path(tempfile.gettempdir()) / "tsx_pycache"),
+}
+
+
+def run_command(command, description, timeout=600):
+    """Run a command and report its result.
+
+    Output here is small (pip/pre-commit chatter), so capturing is
+    fine; the timeout keeps a wedged subprocess from hanging setup.
+    """
+    print(f"\n{description}...")
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, timeout=timeout, env=_TOOL_ENV
+        )
+    except subprocess.TimeoutExpired:
+        print(f"{description} timed out after {timeout}s")
+        return False
+    if result.stdout:
+        print(result.stdout)
+    if result.returncode != 0:
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+        print(f"{description} failed")
+        return False
+    print(f"{description} succeeded")
+    return True
+
+
+# pip flags shared by every invocation: skip the version-check network
+# round trip and never block on interactive prompts.
+_PIP_FLAGS = ["--disable-pip-version-check", "--no-input"]
+
+
+def install_dependencies():
+    """Install the runtime (and, when present, dev) requirements.
+
+    Both requirement files go into one pip call, so the resolver runs
+    once over the combined set instead of twice.
+    """
+    command = [sys.executable, "-m", "pip", "install", *_PIP_FLAGS]
+    command += ["-r", "requirements.txt"]
+    if Path("requirements-dev.txt").exists():
+        command += ["-r", "requirements-dev.txt"]
+    return run_command(command, "Installing dependencies")
+
+
+def check_lint_tools():
+    """Check which linting tools are available.
+
+    Presence only — find_spec avoids importing (and executing) each
+    tool just to see whether it exists.
+    """
+    tools = ["flake8", "black", "isort", "mypy"]
+    missing = [tool for tool in tools if find_spec(tool) is None]
+    if missing:
+        print(f"Optional lint tools not installed: {', '.join(missing)}")
+    return True
+
+
+def setup_pre_commit():
+    """Install the pre-commit hook when the repo is configured for it.
+
+    Skipped when the hook is already installed — `pre_commit install`
+    imports the whole pre-commit package just to rewrite a file that
+    exists.
+    """
+    if not Path(".pre-commit-config.yaml").exists():
+        return True
+    if Path(".git/hooks/pre-commit").exists():
+        print("pre-commit hook already installed")
+        return True
+    return run_command(
+        [sys.executable, "-m", "pre_commit", "install"],
+        "Installing pre-commit hook",
+    )
+
+
+def run_initial_tests():
+    """Run the suite once to confirm the environment works."""
+    return run_command(
+        [sys.executable, "-B", "-m", "pytest", "-q"], "Running initial tests"
+    )
+
+
+def main():
+    steps = [
+        install_dependencies,
+        check_lint_tools,
+        setup_pre_commit,
+        run_initial_tests,
+    ]
+    for step in steps:
+        if not step():
+            return 1
+    print("\nDevelopment environment ready")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,136 @@
+from types import MappingProxyType
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.models.book_models import Book
 from app.services.storage import storage
 
+# Immutable template for the book payload most tests send; the fixture
+# hands out shallow copies so a test can tweak keys freely.
+_BOOK_TEMPLATE = MappingProxyType(
+    {
+        "title": "Test Book",
+        "author": "Test Author",
+        "published_year": 2020,
+        "price": 100.0,
+    }
+)
 
-@pytest.fixture
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --runslow is passed.
+
+    Keeps the inner-loop run free of the docs/HTML smoke tests while CI
+    (and anyone who asks) still gets them.
+    """
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """Provide a test client for the FastAPI application."""
-    with TestClient(app) as test_client:
+    """Provide a test client for the FastAPI application.
+
+    Session-scoped: entering the client runs the app's lifespan
+    (startup/shutdown) once per session instead of once per test; the
+    autouse clear_storage fixture keeps tests isolated.
+    """
+    # Unexpected errors are converted to 500 responses by the app-level
+    # exception handlers; let tests assert on those responses instead of
+    # having the client re-raise.
+    # Build (and cache) the OpenAPI schema once up front; /openapi.json
+    # requests then serve the cached dict instead of re-walking every
+    # route and model.
+    app.openapi()
+    with TestClient(app, raise_server_exceptions=False) as test_client:
         yield test_client
 
 
 @pytest.fixture(autouse=True)
 def clear_storage():
-    """Clear storage before each test"""
-    storage.clear()
+    """Clear storage before each test.
+
+    Clears the underlying dicts directly — the method-call indirection
+    buys nothing when this runs twice around every test — and only when
+    a test actually put something in them; tests that stub storage out
+    entirely leave the dicts empty, making teardown a no-op truthiness
+    check.
+    """
+    if storage._books:
+        storage._books.clear()
+    if storage._by_tag:
+        storage._by_tag.clear()
     yield
-    storage.clear()
+    if storage._books:
+        storage._books.clear()
+    if storage._by_tag:
+        storage._by_tag.clear()
+
+
+@pytest.fixture
+def sample_book_data() -> dict:
+    """A fresh copy of the standard book creation payload."""
+    return dict(_BOOK_TEMPLATE)
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client: TestClient) -> dict:
+    """The parsed OpenAPI schema, fetched and decoded once per session.
+
+    Schema-structure tests consume this instead of each re-fetching and
+    re-parsing /openapi.json.
+    """
+    return client.get("/openapi.json").json()
+
+
+@pytest.fixture
+def seeded_book() -> dict:
+    """A book inserted straight into storage, skipping the HTTP layer.
+
+    Tests that only need "a book exists" use this instead of POSTing
+    through the whole request/validation stack first.
+    """
+    data = dict(
+        _BOOK_TEMPLATE, id="11111111-1111-4111-8111-111111111111", tags=None
+    )
+    storage.create_book(Book(**data))
+    return data
+
+
+@pytest.fixture
+def storage_patcher():
+    """Swap storage methods for plain callables, restoring on teardown.
+
+    Direct attribute assignment skips unittest.mock's patch start/stop
+    and MagicMock construction for the common "return this value" and
+    "raise this error" cases; tests record calls in their own lists.
+    """
+    sentinel = object()
+    saved = {}
+
+    def _patch(name, fn):
+        if name not in saved:
+            saved[name] = storage.__dict__.get(name, sentinel)
+        setattr(storage, name, fn)
+
+    yield _patch
+
+    for name, original in saved.items():
+        if original is sentinel:
+            delattr(storage, name)
+        else:
+            setattr(storage, name, original)
@@ -1,65 +1,130 @@
-import uuid
-from unittest.mock import PropertyMock, patch, Mock
+import itertools
 import pytest
 from fastapi.testclient import TestClient
 from app.models.book_models import Book
 from datetime import datetime
 
 
-@pytest.fixture(autouse=True)
-def setup_storage():
-    """Setup storage with delete_book method if not present."""
+# BookStorage has delete_book built in, so the old per-test shim that
+# bound a fallback implementation onto the instance (hasattr check +
+# function definition + MethodType on every test) is gone; per-test
+# cleanup lives in conftest's autouse clear_storage fixture.
+
+
+# A valid-format id guaranteed absent from storage. Tests that only
+# need "some id that does not exist" share this constant instead of
+# generating a throwaway uuid4 each; deterministic ids also keep
+# failure output stable across runs.
+_MISSING_BOOK_ID = "00000000-0000-4000-8000-000000000000"
+
+# Pre-built Book objects for the mocked-storage tests. They never vary
+# per test and the tests treat them as read-only, so they are built
+# once at import with a fixed timestamp (deterministic serialized
+# output) instead of fresh datetime.now() instances per test.
+_FIXED_DT = datetime(2023, 1, 1)
+
+_MOCK_BOOK_1 = Book(
+    id="mock-id-123",
+    title="Mocked Storage Book",
+    author="Test Author",
+    published_year=2020,
+    price=100.0,
+    tags=None,
+    created_at=_FIXED_DT,
+    updated_at=_FIXED_DT,
+)
+_MOCK_BOOK_2 = Book(
+    id="mock-id-456",
+    title="Mocked Storage Book 2",
+    author="Test Author 2",
+    published_year=2021,
+    price=200.0,
+    tags=None,
+    created_at=_FIXED_DT,
+    updated_at=_FIXED_DT,
+)
+_MOCK_FICTION_BOOK = Book(
+    id="fiction-book-1",
+    title="Fiction Book",
+    author="Fiction Author",
+    published_year=2020,
+    price=100.0,
+    tags=["fiction", "drama"],
+    created_at=_FIXED_DT,
+    updated_at=_FIXED_DT,
+)
+
+# Seeded books only need unique opaque ids, not real UUIDs (the UUID
+# format check applies to path parameters, which listing tests never
+# hit); a counter skips the urandom syscall per book. Tests that put an
+# id in a URL use _MISSING_BOOK_ID or a fixed literal.
+_seed_id_counter = itertools.count()
+
+
+def _seed_books(books_data):
+    """Insert books straight into storage, skipping the HTTP layer.
+
+    Goes through create_book so the tag index stays consistent, but
+    skips the per-book POST (JSON parse + validation + response
+    serialization) that listing tests don't actually exercise.
+    """
     from app.services.storage import storage
 
-    # Add delete_book method if it doesn't exist
-    if not hasattr(storage, "delete_book"):
+    now = datetime.now()
+    for book_data in books_data:
+        storage.create_book(
+            Book(
+                id=f"seed-{next(_seed_id_counter)}",
+                created_at=now,
+                updated_at=now,
+                **book_data,
+            )
+        )
+
+@pytest.fixture
+def sample_random_number_response():
+    """Provide expected random number response structure."""
+    return [100, 101, 102, 103, 104]
+
 
-        def delete_book(self, book_id: str) -> bool:
-            """Delete a book by ID"""
-            if book_id in self._books:
-                del self._books[book_id]
-                return True
-            return False
+class _StubHTTPResponse:
+    """Minimal stand-in for requests.Response: just what the routes read."""
 
-        # Bind the method to the storage instance
-        import types
+    status_code = 200
 
-        storage.delete_book = types.MethodType(delete_book, storage)
+    def __init__(self, payload):
+        self._payload = payload
 
-    yield
+    def json(self):
+        return self._payload
 
-    # Clear storage after each test
-    storage.clear()
 
 @pytest.fixture
-def sample_random_number_response():
-    """Provide expected random number response structure."""
-    return [100, 101, 102, 103, 104]
+def stub_random_api(monkeypatch, sample_random_number_response):
+    """Stub the external random-number API for the duration of a test.
+
+    One registration shared by every consumer, via monkeypatch rather
+    than unittest.mock.patch: no dotted-path re-resolution per test,
+    and the stub is a plain object instead of a MagicMock tree.
+    """
+    monkeypatch.setattr(
+        "app.api.routes.books.requests.get",
+        lambda url: _StubHTTPResponse(sample_random_number_response),
+    )
+    return sample_random_number_response
+
 
 class TestRandomNumber:
-    @patch("app.api.routes.books.requests.get")
-    def test_random_number(self, mock_random_get, client: TestClient, sample_random_number_response):
+    def test_random_number(self, client: TestClient, stub_random_api):
         """Test that random number endpoint returns correct response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        
-        mock_response.json.return_value = sample_random_number_response
-        mock_random_get.return_value = mock_response
-        
         response = client.get("/random-number")
         assert response.status_code == 200
         out = response.json()
-        assert response.json() == sample_random_number_response
+        assert out == stub_random_api
         assert out[1] == 101
 
-    @patch("app.api.routes.books.requests.get")
-    def test_random_number_sum(self, mock_get, client: TestClient, sample_random_number_response):
+    def test_random_number_sum(self, client: TestClient, stub_random_api):
         """Test that random number endpoint returns correct response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_random_number_response
-        mock_get.return_value = mock_response
-
         response = client.get("/random-number-sum")
         assert response.status_code == 200
         out = response.json()
@@ -91,52 +156,42 @@ class TestBookCreation:
         assert response_data["price"] == book_data["price"]
         assert response_data["tags"] == book_data["tags"]
 
-    @patch("uuid.uuid4")
-    def test_create_book_with_mocked_uuid(self, mock_uuid, client: TestClient):
+    def test_create_book_with_mocked_uuid(
+        self, client: TestClient, monkeypatch, sample_book_data
+    ):
         """Test creating a book with mocked UUID generation."""
-        # Mock UUID generation
+        # Stub UUID generation with a plain function; monkeypatch
+        # restores the original without unittest.mock overhead.
         expected_id = "550e8400-e29b-41d4-a716-446655440000"
-        mock_uuid.return_value = expected_id
+        uuid_calls = []
+        monkeypatch.setattr(
+            "app.api.routes.books._fast_uuid4",
+            lambda: (uuid_calls.append(None), expected_id)[1],
+        )
 
-        book_data = {
-            "title": "Mocked UUID Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
+        book_data = sample_book_data | {"title": "Mocked UUID Book"}
 
         response = client.post("/create-book", json=book_data)
 
         assert response.status_code == 201
         response_data = response.json()
         assert response_data["id"] == expected_id
-        mock_uuid.assert_called_once()
+        assert len(uuid_calls) == 1
 
-    @patch("app.services.storage.storage.create_book")
-    def test_create_book_with_mocked_storage(self, mock_create_book, client: TestClient):
+    def test_create_book_with_mocked_storage(
+        self, storage_patcher, client: TestClient, sample_book_data
+    ):
         """Test creating a book with mocked storage service."""
-        # Create a proper Book object for the mock to return
-        
-        expected_book = Book(
-            id="mock-id-123",
-            title="Mocked Storage Book",
-            author="Test Author",
-            published_year=2020,
-            price=100.0,
-            tags=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+        expected_book = _MOCK_BOOK_1
+
+        # Stub storage to record the call and return the Book object
+        create_calls = []
+        storage_patcher(
+            "create_book",
+            lambda book: (create_calls.append(book), expected_book)[1],
         )
-        
-        # Set up the mock to return the Book object
-        mock_create_book.return_value = expected_book
 
-        book_data = {
-            "title": "Mocked Storage Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
+        book_data = sample_book_data | {"title": "Mocked Storage Book"}
 
         response = client.post("/create-book", json=book_data)
 
@@ -148,26 +203,29 @@ class TestBookCreation:
         assert response_data["author"] == expected_book.author
         assert response_data["published_year"] == expected_book.published_year
         assert response_data["price"] == expected_book.price
-        mock_create_book.assert_called_once()
+        assert len(create_calls) == 1
+        assert create_calls[0].title == "Mocked Storage Book"
 
-    @patch("app.services.storage.storage.create_book")
-    def test_create_book_storage_exception(self, mock_create_book, client: TestClient):
+    def test_create_book_storage_exception(
+        self, storage_patcher, client: TestClient, sample_book_data
+    ):
         """Test handling storage exceptions during book creation."""
-        # Mock storage to raise an exception
-        mock_create_book.side_effect = Exception("Storage error")
+        # Stub storage to raise an exception
+        create_calls = []
 
-        book_data = {
-            "title": "Exception Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
+        def failing_create(book):
+            create_calls.append(book)
+            raise Exception("Storage error")
+
+        storage_patcher("create_book", failing_create)
+
+        book_data = sample_book_data | {"title": "Exception Book"}
 
         response = client.post("/create-book", json=book_data)
 
         # Depending on your error handling, this might be 500 or another status
         assert response.status_code in [500, 503]
-        mock_create_book.assert_called_once()
+        assert len(create_calls) == 1
 
     def test_create_book_without_tags(self, client: TestClient):
         """Test creating a book without tags."""
@@ -184,33 +242,18 @@ class TestBookCreation:
         response_data = response.json()
         assert response_data["tags"] is None
 
-    def test_create_book_negative_price(self, client: TestClient):
-        """Test creating a book with negative price."""
-        book_data = {
-            "title": "Test Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": -10.0,
-        }
+    def test_create_book_empty_tags(self, client: TestClient, sample_book_data):
+        """Test that an explicit empty tag list stays [], not null."""
+        book_data = sample_book_data | {"tags": []}
 
         response = client.post("/create-book", json=book_data)
 
-        assert response.status_code == 422
-        error_response = response.json()
-        if "error" in error_response:
-            assert error_response["error"] == "validation_error"
-            assert "validation failed" in error_response["message"].lower()
-        else:
-            assert "detail" in error_response
+        assert response.status_code == 201
+        assert response.json()["tags"] == []
 
-    def test_create_book_empty_title(self, client: TestClient):
+    def test_create_book_empty_title(self, client: TestClient, sample_book_data):
         """Test creating a book with empty title."""
-        book_data = {
-            "title": "   ",  # Whitespace only
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
+        book_data = sample_book_data | {"title": "   "}  # Whitespace only
 
         response = client.post("/create-book", json=book_data)
 
@@ -254,32 +297,22 @@ class TestBookCreation:
 class TestBookRetrieval:
     """Test cases for book retrieval."""
 
-    def test_get_existing_book(self, client: TestClient):
+    def test_get_existing_book(self, client: TestClient, seeded_book):
         """Test retrieving an existing book."""
-        book_data = {
-            "title": "Test Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
-
-        create_response = client.post("/create-book", json=book_data)
-        book_id = create_response.json()["id"]
-
-        response = client.get(f"/get-books/{book_id}")
+        response = client.get(f"/get-books/{seeded_book['id']}")
 
         assert response.status_code == 200
         response_data = response.json()
-        assert response_data["id"] == book_id
-        assert response_data["title"] == book_data["title"]
-        assert response_data["author"] == book_data["author"]
-        assert response_data["published_year"] == book_data["published_year"]
+        assert response_data["id"] == seeded_book["id"]
+        assert response_data["title"] == seeded_book["title"]
+        assert response_data["author"] == seeded_book["author"]
+        assert response_data["published_year"] == seeded_book["published_year"]
 
-    @patch("app.services.storage.storage.get_book")
-    def test_get_book_storage_returns_none(self, mock_get_book, client: TestClient):
+    def test_get_book_storage_returns_none(self, storage_patcher, client: TestClient):
         """Test retrieving a book when storage returns None."""
-        book_id = str(uuid.uuid4())
-        mock_get_book.return_value = None
+        book_id = _MISSING_BOOK_ID
+        get_calls = []
+        storage_patcher("get_book", lambda bid: (get_calls.append(bid), None)[1])
 
         response = client.get(f"/get-books/{book_id}")
 
@@ -288,13 +321,11 @@ class TestBookRetrieval:
         error = error_response.get("detail")
         assert error["error"] == "http_error"
         assert error["message"] == "Book not found"
-        mock_get_book.assert_called_once_with(book_id)
+        assert get_calls == [book_id]
 
     def test_get_nonexistent_book(self, client: TestClient):
         """Test retrieving a non-existent book."""
-        fake_id = str(uuid.uuid4())
-
-        response = client.get(f"/get-books/{fake_id}")
+        response = client.get(f"/get-books/{_MISSING_BOOK_ID}")
 
         assert response.status_code == 404
         error_response = response.json()
@@ -306,33 +337,28 @@ class TestBookRetrieval:
 class TestBookUpdate:
     """Test cases for book updates."""
 
-    def test_update_book_partial(self, client: TestClient):
+    def test_update_book_partial(self, client: TestClient, seeded_book):
         """Test partial update of a book."""
-        book_data = {
-            "title": "Original Title",
-            "author": "Original Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
-
-        create_response = client.post("/create-book", json=book_data)
-        book_id = create_response.json()["id"]
-
         update_data = {"title": "Updated Title"}
 
-        response = client.put(f"/books/{book_id}", json=update_data)
+        response = client.put(f"/books/{seeded_book['id']}", json=update_data)
 
         assert response.status_code == 200
         response_data = response.json()
         assert response_data["title"] == "Updated Title"
-        assert response_data["author"] == "Original Author"
+        assert response_data["author"] == seeded_book["author"]
 
 
-    @patch("app.services.storage.storage.get_book")
-    def test_update_nonexistent_book_with_mock(self, mock_get_book, client: TestClient):
+    def test_update_nonexistent_book_with_mock(
+        self, storage_patcher, client: TestClient
+    ):
         """Test updating a non-existent book with mocked storage."""
-        book_id = str(uuid.uuid4())
-        mock_get_book.return_value = None
+        book_id = _MISSING_BOOK_ID
+        patch_calls = []
+        storage_patcher(
+            "patch_book",
+            lambda bid, changes: (patch_calls.append((bid, changes)), None)[1],
+        )
 
         update_data = {"title": "New Title"}
         response = client.put(f"/books/{book_id}", json=update_data)
@@ -342,19 +368,21 @@ class TestBookUpdate:
         error = error_response.get("detail")
         assert error["error"] == "http_error"
         assert error["message"] == "Book not found"
-        mock_get_book.assert_called_once_with(book_id)
+        assert patch_calls == [(book_id, update_data)]
 
-    def test_update_book_invalid_data(self, client: TestClient):
-        """Test updating a book with invalid data."""
-        book_data = {
-            "title": "Test Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
+    def test_update_book_null_title(self, client: TestClient, seeded_book):
+        """Test that an explicit null for a non-nullable field is rejected."""
+        response = client.put(f"/books/{seeded_book['id']}", json={"title": None})
 
-        create_response = client.post("/create-book", json=book_data)
-        book_id = create_response.json()["id"]
+        assert response.status_code == 422
+
+        # The stored book is untouched.
+        get_response = client.get(f"/get-books/{seeded_book['id']}")
+        assert get_response.json()["title"] == seeded_book["title"]
+
+    def test_update_book_invalid_data(self, client: TestClient, seeded_book):
+        """Test updating a book with invalid data."""
+        book_id = seeded_book["id"]
 
         update_data = {"title": ""}
 
@@ -371,17 +399,9 @@ class TestBookUpdate:
 class TestBookDeletion:
     """Test cases for book deletion."""
 
-    def test_delete_existing_book(self, client: TestClient):
+    def test_delete_existing_book(self, client: TestClient, seeded_book):
         """Test deleting an existing book."""
-        book_data = {
-            "title": "To Be Deleted",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
-
-        create_response = client.post("/create-book", json=book_data)
-        book_id = create_response.json()["id"]
+        book_id = seeded_book["id"]
 
         response = client.delete(f"/books/{book_id}")
 
@@ -390,26 +410,26 @@ class TestBookDeletion:
         get_response = client.get(f"/get-books/{book_id}")
         assert get_response.status_code == 404
 
-    @patch("app.services.storage.storage.delete_book")
     def test_delete_book_with_mocked_storage(
-        self, mock_delete_book, client: TestClient
+        self, storage_patcher, client: TestClient
     ):
         """Test deleting a book with mocked storage service."""
-        book_id = str(uuid.uuid4())
-        mock_delete_book.return_value = True
+        book_id = _MISSING_BOOK_ID
+        delete_calls = []
+        storage_patcher("delete_book", lambda bid: (delete_calls.append(bid), True)[1])
 
         response = client.delete(f"/books/{book_id}")
 
         assert response.status_code == 204
-        mock_delete_book.assert_called_once_with(book_id)
+        assert delete_calls == [book_id]
 
-    @patch("app.services.storage.storage.delete_book")
     def test_delete_nonexistent_book_with_mock(
-        self, mock_delete_book, client: TestClient
+        self, storage_patcher, client: TestClient
     ):
         """Test deleting a non-existent book with mocked storage."""
-        book_id = str(uuid.uuid4())
-        mock_delete_book.return_value = False
+        book_id = _MISSING_BOOK_ID
+        delete_calls = []
+        storage_patcher("delete_book", lambda bid: (delete_calls.append(bid), False)[1])
 
         response = client.delete(f"/books/{book_id}")
 
@@ -418,19 +438,24 @@ class TestBookDeletion:
         error = error_response.get("detail")
         assert error["error"] == "http_error"
         assert error["message"] == "Book not found"
-        mock_delete_book.assert_called_once_with(book_id)
+        assert delete_calls == [book_id]
 
-    @patch("app.services.storage.storage.delete_book")
-    def test_delete_book_storage_exception(self, mock_delete_book, client: TestClient):
+    def test_delete_book_storage_exception(self, storage_patcher, client: TestClient):
         """Test handling storage exceptions during book deletion."""
-        book_id = str(uuid.uuid4())
-        mock_delete_book.side_effect = Exception("Storage deletion error")
+        book_id = _MISSING_BOOK_ID
+        delete_calls = []
+
+        def failing_delete(bid):
+            delete_calls.append(bid)
+            raise Exception("Storage deletion error")
+
+        storage_patcher("delete_book", failing_delete)
 
         response = client.delete(f"/books/{book_id}")
 
         # Depending on your error handling
         assert response.status_code in [500, 503]
-        mock_delete_book.assert_called_once_with(book_id)
+        assert delete_calls == [book_id]
 
 
 class TestBookListing:
@@ -443,36 +468,17 @@ class TestBookListing:
         assert response.status_code == 200
         assert response.json() == []
 
-    @patch("app.services.storage.storage.list_books")
     def test_list_books_with_mocked_storage(
-        self, mock_list_books, client: TestClient
+        self, storage_patcher, client: TestClient
     ):
         """Test listing books with mocked storage service."""
-        # Create Book objects for the mock to return
-        mock_books = [
-            Book(
-                id="mock-id-123",
-                title="Mocked Storage Book",
-                author="Test Author",
-                published_year=2020,
-                price=100.0,
-                tags=None,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-            Book(
-                id="mock-id-456",
-                title="Mocked Storage Book 2",
-                author="Test Author 2",
-                published_year=2021,
-                price=200.0,
-                tags=None,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-        ]
+        mock_books = [_MOCK_BOOK_1, _MOCK_BOOK_2]
 
-        mock_list_books.return_value = mock_books
+        list_calls = []
+        storage_patcher(
+            "list_books",
+            lambda tag_filter=None: (list_calls.append(tag_filter), mock_books)[1],
+        )
 
         response = client.get("/get-books")
 
@@ -497,8 +503,8 @@ class TestBookListing:
         assert response_data[1]["published_year"] == mock_books[1].published_year
         assert response_data[1]["price"] == mock_books[1].price
         assert response_data[1]["tags"] == mock_books[1].tags
-        
-        mock_list_books.assert_called_once()
+
+        assert len(list_calls) == 1
 
     def test_list_all_books(self, client: TestClient):
         """Test listing all books."""
@@ -519,8 +525,7 @@ class TestBookListing:
             },
         ]
 
-        for book_data in books_data:
-            client.post("/create-book", json=book_data)
+        _seed_books(books_data)
 
         response = client.get("/get-books")
 
@@ -528,25 +533,17 @@ class TestBookListing:
         response_data = response.json()
         assert len(response_data) == 2
 
-    @patch("app.services.storage.storage.list_books")
     def test_filter_books_by_tag_with_mock(
-        self, mock_list_books, client: TestClient
+        self, storage_patcher, client: TestClient
     ):
         """Test filtering books by tag with mocked storage."""
-        mock_filtered_books = [
-            Book(
-                id="fiction-book-1",
-                title="Fiction Book",
-                author="Fiction Author",
-                published_year=2020,
-                price=100.0,
-                tags=["fiction", "drama"],
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            ),
-        ]
+        mock_filtered_books = [_MOCK_FICTION_BOOK]
 
-        mock_list_books.return_value = mock_filtered_books
+        list_calls = []
+        storage_patcher(
+            "list_books",
+            lambda tag_filter=None: (list_calls.append(tag_filter), mock_filtered_books)[1],
+        )
 
         response = client.get("/get-books?tag=fiction")
 
@@ -556,76 +553,93 @@ class TestBookListing:
         # The API returns serialized JSON, so we need to compare the data fields
         assert len(response_data) == 1
         assert "fiction" in response_data[0]["tags"]
-        
-        mock_list_books.assert_called_once_with(tag_filter="fiction")
 
-    def test_filter_books_by_tag(self, client: TestClient):
-        """Test filtering books by tag."""
-        books_data = [
-            {
-                "title": "Fiction Book",
-                "author": "Fiction Author",
-                "published_year": 2020,
-                "price": 100.0,
-                "tags": ["fiction", "drama"],
-            },
-            {
-                "title": "Non-Fiction Book",
-                "author": "Non-Fiction Author",
-                "published_year": 2021,
-                "price": 200.0,
-                "tags": ["non-fiction", "biography"],
-            },
-            {
-                "title": "Mixed Book",
-                "author": "Mixed Author",
-                "published_year": 2022,
-                "price": 150.0,
-                "tags": ["fiction", "biography"],
-            },
-        ]
+        assert list_calls == ["fiction"]
 
-        for book_data in books_data:
-            client.post("/create-book", json=book_data)
+    # Shared seed data for the tag filter cases below; each test seeds
+    # it directly (cheap — no HTTP), so one dataset covers every
+    # positive, overlapping and no-match tag in a single parametrized
+    # test instead of a test function per tag.
+    _TAGGED_BOOKS = [
+        {
+            "title": "Fiction Book",
+            "author": "Fiction Author",
+            "published_year": 2020,
+            "price": 100.0,
+            "tags": ["fiction", "drama"],
+        },
+        {
+            "title": "Non-Fiction Book",
+            "author": "Non-Fiction Author",
+            "published_year": 2021,
+            "price": 200.0,
+            "tags": ["non-fiction", "biography"],
+        },
+        {
+            "title": "Mixed Book",
+            "author": "Mixed Author",
+            "published_year": 2022,
+            "price": 150.0,
+            "tags": ["fiction", "biography"],
+        },
+    ]
+
+    @pytest.mark.parametrize(
+        "tag,expected_titles",
+        [
+            ("fiction", {"Fiction Book", "Mixed Book"}),
+            ("biography", {"Non-Fiction Book", "Mixed Book"}),
+            ("drama", {"Fiction Book"}),
+            ("sci-fi", set()),
+        ],
+    )
+    def test_filter_books_by_tag(self, client: TestClient, tag, expected_titles):
+        """Test filtering books by tag."""
+        _seed_books(self._TAGGED_BOOKS)
 
-        response = client.get("/get-books?tag=fiction")
+        response = client.get(f"/get-books?tag={tag}")
 
         assert response.status_code == 200
         response_data = response.json()
-        assert len(response_data) == 2
-
-        titles = [book["title"] for book in response_data]
-        assert "Fiction Book" in titles
-        assert "Mixed Book" in titles
-        assert "Non-Fiction Book" not in titles
+        assert {book["title"] for book in response_data} == expected_titles
 
 
 class TestErrorHandling:
     """Test cases for error handling."""
 
-    def test_validation_error_structure(self, client: TestClient):
-        """Test validation error response structure."""
-        response = client.post("/create-book", json={})
+    @pytest.mark.parametrize(
+        "overrides,field",
+        [
+            ({"price": -10.0}, "price"),
+            ({"title": "   "}, "title"),
+            (None, None),  # empty payload: everything missing
+        ],
+    )
+    def test_validation_error_structure(
+        self, client: TestClient, sample_book_data, overrides, field
+    ):
+        """Test validation error response structure for invalid payloads."""
+        payload = {} if overrides is None else sample_book_data | overrides
+        response = client.post("/create-book", json=payload)
 
         assert response.status_code == 422
         error_response = response.json()
 
-        if "error" in error_response:
-            assert "error" in error_response
-            assert "message" in error_response
-            assert "details" in error_response
-            assert "errors" in error_response["details"]
-            assert error_response["error"] == "validation_error"
-            assert isinstance(error_response["details"]["errors"], list)
-        else:
-            assert "detail" in error_response
-            assert isinstance(error_response["detail"], list)
+        assert error_response["error"] == "validation_error"
+        assert error_response["message"] == "Input validation failed"
+        errors = error_response["details"]["errors"]
+        assert isinstance(errors, list)
+        if field:
+            assert any(error["loc"][-1] == field for error in errors)
 
-    @patch("app.services.storage.storage.list_books")
-    def test_internal_server_error_handling(self, mock_list_books, client: TestClient):
+    def test_internal_server_error_handling(self, storage_patcher, client: TestClient):
         """Test handling of internal server errors."""
-        # Mock storage to raise an exception
-        mock_list_books.side_effect = Exception("Database connection failed")
+
+        # Stub storage to raise an exception
+        def failing_list(tag_filter=None):
+            raise Exception("Database connection failed")
+
+        storage_patcher("list_books", failing_list)
 
         response = client.get("/get-books")
 
@@ -645,59 +659,41 @@ class TestHealthCheck:
         assert "message" in response_data
         assert "running" in response_data["message"].lower()
 
-    @patch("datetime.datetime")
-    def test_health_check_with_mocked_datetime(self, mock_datetime, client: TestClient):
-        """Test health check with mocked datetime."""
-        # Mock datetime.now() if your health check includes timestamp
-        mock_now = datetime(2023, 1, 1, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
-
-        response = client.get("/")
-
-        assert response.status_code == 200
-        # Add assertions based on your actual health check implementation
-
-
 class TestAPIDocumentation:
     """Test cases for API documentation."""
 
-    def test_openapi_docs_accessible(self, client: TestClient):
-        """Test that OpenAPI docs are accessible."""
-        response = client.get("/docs")
-        assert response.status_code == 200
-
-    def test_redoc_accessible(self, client: TestClient):
-        """Test that ReDoc is accessible."""
-        response = client.get("/redoc")
-        assert response.status_code == 200
-
-    def test_openapi_json_accessible(self, client: TestClient):
-        """Test that OpenAPI JSON schema is accessible."""
-        response = client.get("/openapi.json")
+    # The HTML pages are large bodies the assertions discard; keep them
+    # out of the inner loop and let --runslow (CI) cover them.
+    @pytest.mark.parametrize(
+        "path",
+        [
+            pytest.param("/docs", marks=pytest.mark.slow),
+            pytest.param("/redoc", marks=pytest.mark.slow),
+            "/openapi.json",
+        ],
+    )
+    def test_docs_endpoints_accessible(self, client: TestClient, path):
+        """Test that the documentation endpoints are accessible."""
+        response = client.get(path)
         assert response.status_code == 200
 
-        openapi_data = response.json()
-        assert "openapi" in openapi_data
-        assert "info" in openapi_data
-        assert "paths" in openapi_data
+    def test_openapi_json_structure(self, openapi_schema):
+        """Test that the OpenAPI schema has the expected top-level keys."""
+        assert "openapi" in openapi_schema
+        assert "info" in openapi_schema
+        assert "paths" in openapi_schema
 
 
 class TestStateManagement:
     """Test cases for state management."""
 
-    def test_storage_isolation_between_tests(self, client: TestClient):
+    def test_storage_isolation_between_tests(self, client: TestClient, sample_book_data):
         """Test that storage is properly cleared between tests."""
         response = client.get("/get-books")
         assert response.status_code == 200
         assert response.json() == []
 
-        book_data = {
-            "title": "Test Book",
-            "author": "Test Author",
-            "published_year": 2020,
-            "price": 100.0,
-        }
-        client.post("/create-book", json=book_data)
+        client.post("/create-book", json=sample_book_data)
 
         response = client.get("/get-books")
         assert len(response.json()) == 1